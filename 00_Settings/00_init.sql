@@ -49,6 +49,10 @@ CREATE TABLE public.pgbench_history (
 -- Aurora PostgreSQL에 pg_stat_statements 확장 설치
 CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
 
+-- 계층형 Warming(WARMING_MODE=tiered)에서 인덱스 페이지 적재용 pageinspect, pg_prewarm 확장 설치
+CREATE EXTENSION IF NOT EXISTS pageinspect;
+CREATE EXTENSION IF NOT EXISTS pg_prewarm;
+
 -- Top100 쿼리 추출
 -- SELECT 쿼리만 추출하기
 SELECT 
@@ -9,6 +9,22 @@ import psycopg2
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# 계층형 Warming의 계층 이름, 시간 예산(초) 환경 변수 이름, 기본값
+TIER_BUDGET_ENVS = [
+    ('index_internal', 'TIER_INDEX_INTERNAL_BUDGET', '60'),
+    ('index_leaf', 'TIER_INDEX_LEAF_BUDGET', '240'),
+    ('heap', 'TIER_HEAP_BUDGET', '480'),
+]
+
+# 리프 페이지 적재 시 한 번에 읽을 블록 수
+LEAF_CHUNK_BLOCKS = 1024
+
+# 중복 적재 제외 시 같은 인덱스/테이블을 연속으로 건너뛸 수 있는 최대 쿼리 수
+COVERAGE_MAX_SKIPS = 3
+
+# Lambda 제한 시간 전에 작업을 마치기 위한 여유 시간(초)
+LAMBDA_SAFETY_MARGIN = 60
+
 def get_secret_credentials():
     """
     Secret Manager에서 데이터베이스 인증 정보를 가져오는 함수
@@ -217,13 +233,14 @@ def parse_queries_from_csv(csv_content):
     
     return queries
 
-def execute_warming_queries(conn, queries):
+def execute_warming_queries(conn, queries, deadline=None):
     """
     DB warming을 위해 쿼리를 실행하는 함수
     
     Args:
         conn (psycopg2.connection): 데이터베이스 연결
         queries (list): 실행할 쿼리 목록
+        deadline (float): 실행 종료 시각(time.time() 기준), None이면 제한 없음
         
     Returns:
         int: 성공적으로 실행된 쿼리 수
@@ -235,6 +252,10 @@ def execute_warming_queries(conn, queries):
     cursor = conn.cursor()
     
     for i, query in enumerate(queries):
+        if deadline is not None and time.time() >= deadline:
+            logger.info(f"시간 예산 소진으로 쿼리 실행 중단: {i}/{len(queries)}개 실행")
+            break
+        
         query_start_time = time.time()
         try:
             cursor.execute(query)
@@ -243,6 +264,8 @@ def execute_warming_queries(conn, queries):
             logger.info(f"쿼리 {i+1}/{len(queries)} 실행 성공: {query_end_time - query_start_time:.2f} 초")
         except Exception as e:
             logger.warning(f"쿼리 {i+1}/{len(queries)} 실행 실패: {str(e)}")
+            # 실패한 트랜잭션이 이후 쿼리 실행을 막지 않도록 롤백
+            conn.rollback()
     
     cursor.close()
     
@@ -251,6 +274,617 @@ def execute_warming_queries(conn, queries):
     
     return success_count
 
+def get_query_plan(cursor, query, analyze=False, generic=False):
+    """
+    쿼리의 실행 계획을 EXPLAIN (VERBOSE, FORMAT JSON)으로 조회하는 함수
+    
+    Args:
+        cursor (psycopg2.cursor): 데이터베이스 커서
+        query (str): 실행 계획을 조회할 쿼리
+        analyze (bool): True이면 ANALYZE, BUFFERS로 쿼리를 실제 실행
+        generic (bool): True이면 GENERIC_PLAN으로 $1 등 파라미터가 포함된 쿼리의 실행 계획 조회
+                        (PostgreSQL 16 이상, analyze와 함께 사용할 수 없음)
+        
+    Returns:
+        dict: 최상위 실행 계획 노드
+    """
+    if analyze:
+        options = 'ANALYZE, BUFFERS, TIMING OFF, VERBOSE, FORMAT JSON'
+    elif generic:
+        options = 'GENERIC_PLAN, VERBOSE, FORMAT JSON'
+    else:
+        options = 'VERBOSE, FORMAT JSON'
+    
+    cursor.execute(f"EXPLAIN ({options}) {query}")
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    
+    return plan[0]['Plan']
+
+def collect_plan_scans(plan, scans, schema=None, loops=1):
+    """
+    실행 계획에서 테이블/인덱스를 읽는 스캔 노드 정보를 재귀적으로 수집하는 함수
+    
+    Bitmap Index Scan 노드에는 스키마가 표시되지 않으므로 상위 노드(Bitmap Heap Scan)의
+    스키마를 사용한다. BUFFERS 값은 하위 노드를 포함한 누적값이므로 하위 노드의 값을 빼서
+    노드 자신의 값만 기록한다. Index Scan 노드의 블록 수에는 인덱스와 테이블 블록이 함께 포함된다.
+    
+    Plan Rows는 1회 실행(loop) 기준이고 BUFFERS 값은 전체 반복 실행의 합계이므로, rows에는
+    Plan Rows × 반복 횟수를 기록한다. 반복 횟수는 ANALYZE 결과이면 Actual Loops를,
+    아니면 Nested Loop의 Inner 노드와 SubPlan에 대해 상위 노드의 예상 행 수로 추정한 값을 사용한다.
+    
+    Args:
+        plan (dict): 실행 계획 노드 (EXPLAIN VERBOSE 결과)
+        scans (list): 스캔 노드 정보(schema, relation, index, rows, read, hit)를 추가할 목록
+        schema (str): 상위 노드의 스키마 이름
+        loops (float): 상위 노드로부터 추정한 이 노드의 반복 실행 횟수
+    """
+    schema = plan.get('Schema', schema)
+    children = plan.get('Plans', [])
+    loops = plan.get('Actual Loops', loops)
+    
+    if 'Index Name' in plan or 'Relation Name' in plan:
+        read = plan.get('Shared Read Blocks', 0) - sum(c.get('Shared Read Blocks', 0) for c in children)
+        hit = plan.get('Shared Hit Blocks', 0) - sum(c.get('Shared Hit Blocks', 0) for c in children)
+        scans.append({
+            'schema': schema,
+            'relation': plan.get('Relation Name'),
+            'index': plan.get('Index Name'),
+            'rows': plan.get('Plan Rows', 0) * loops,
+            'read': max(read, 0),
+            'hit': max(hit, 0)
+        })
+    
+    # Nested Loop의 Inner 노드는 Outer 노드의 행 수만큼, SubPlan은 현재 노드의 행 수만큼 반복 실행
+    outer_rows = next((c.get('Plan Rows', 0) for c in children if c.get('Parent Relationship') == 'Outer'), 1)
+    for child in children:
+        child_loops = loops
+        if 'Actual Loops' not in child:
+            relationship = child.get('Parent Relationship')
+            if plan.get('Node Type') == 'Nested Loop' and relationship == 'Inner':
+                child_loops = loops * max(outer_rows, 1)
+            elif relationship == 'SubPlan':
+                child_loops = loops * max(plan.get('Plan Rows', 0), 1)
+        collect_plan_scans(child, scans, schema, child_loops)
+
+def get_scan_block_counts(scans):
+    """
+    스캔 노드 정보를 인덱스/테이블별로 합산하는 함수
+    
+    인덱스를 사용하는 스캔은 ('index', 스키마, 인덱스 이름), 그 외 스캔은
+    ('table', 스키마, 테이블 이름)을 키로 사용한다. Index Scan의 블록 수에는
+    테이블 블록도 포함되므로 인덱스 키에 함께 집계된다.
+    
+    Args:
+        scans (list): collect_plan_scans로 수집한 스캔 노드 정보 목록
+        
+    Returns:
+        dict: 키별 {'rows', 'read', 'hit'} 사전
+    """
+    block_counts = {}
+    
+    for scan in scans:
+        if scan['index']:
+            key = ('index', scan['schema'], scan['index'])
+        else:
+            key = ('table', scan['schema'], scan['relation'])
+        
+        counts = block_counts.setdefault(key, {'rows': 0, 'read': 0, 'hit': 0})
+        counts['rows'] += scan['rows']
+        counts['read'] += scan['read']
+        counts['hit'] += scan['hit']
+    
+    return block_counts
+
+def get_coverage_threshold():
+    """
+    환경 변수에서 중복 적재 쿼리 건너뛰기 기준(신규 블록 수)을 가져오는 함수
+    
+    Returns:
+        float: 건너뛰기 기준 블록 수, 설정되지 않은 경우 None
+        
+    Raises:
+        ValueError: 기준 값이 올바르지 않은 경우
+    """
+    value = os.environ.get('COVERAGE_SKIP_THRESHOLD')
+    if value is None:
+        return None
+    
+    try:
+        threshold = float(value)
+    except ValueError:
+        threshold = -1
+    
+    if threshold < 0:
+        error_msg = f"환경 변수 'COVERAGE_SKIP_THRESHOLD'의 값이 올바르지 않습니다: {value}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    
+    return threshold
+
+def execute_coverage_warming_queries(conn, queries, threshold, deadline=None):
+    """
+    이미 캐시된 블록만 읽을 것으로 예상되는 쿼리를 건너뛰며 DB warming 쿼리를 실행하는 함수
+    
+    각 쿼리는 EXPLAIN (ANALYZE, BUFFERS)로 실행하여 인덱스/테이블별로 다음 두 값을 기록한다.
+    - 예상 행당 블록 수: (read + hit) / (예상 행 수(Plan Rows) × 실제 반복 횟수(Actual Loops))
+    - 미적재 비율: read / (read + hit)
+    
+    이후 쿼리는 실행 전 실행 계획(EXPLAIN)으로 대상 인덱스/테이블과 예상 행 수를 확인하고
+    (Nested Loop의 Inner 쪽 스캔은 Outer 쪽 예상 행 수를 곱함),
+    예상 신규 블록 수 = Σ(예상 행 수 × 예상 행당 블록 수 × 미적재 비율)이 기준보다 작으면 건너뛴다.
+    처음 접근하는 인덱스/테이블이 포함되거나, 대상 중 하나라도 연속으로 COVERAGE_MAX_SKIPS번
+    건너뛴 경우에는 기록을 갱신하기 위해 항상 실행한다.
+    
+    Args:
+        conn (psycopg2.connection): 데이터베이스 연결
+        queries (list): 실행할 쿼리 목록
+        threshold (float): 건너뛰기 기준 신규 블록 수
+        deadline (float): 실행 종료 시각(time.time() 기준), None이면 제한 없음
+        
+    Returns:
+        dict: 성공/건너뛴 쿼리 수와 새로 읽은 블록 수
+    """
+    start_time = time.time()
+    logger.info(f"DB warming 시작(중복 적재 제외, 기준 {threshold} 블록): {len(queries)}개 쿼리 실행")
+    
+    success_count = 0
+    skipped_count = 0
+    blocks_read = 0
+    blocks_hit = 0
+    # 인덱스/테이블별 {'blocks_per_row', 'miss_ratio', 'skips'}
+    coverage = {}
+    cursor = conn.cursor()
+    
+    for i, query in enumerate(queries):
+        if deadline is not None and time.time() >= deadline:
+            logger.info(f"시간 예산 소진으로 쿼리 실행 중단: {i}/{len(queries)}개 실행")
+            break
+        
+        query_start_time = time.time()
+        try:
+            # 실행 기록이 있으면 실행 계획으로 신규 블록 수 추정
+            if coverage:
+                scans = []
+                collect_plan_scans(get_query_plan(cursor, query), scans)
+                planned = get_scan_block_counts(scans)
+                
+                known = all(
+                    key in coverage and coverage[key]['skips'] < COVERAGE_MAX_SKIPS
+                    for key in planned
+                )
+                if planned and known:
+                    estimated_blocks = sum(
+                        counts['rows'] * coverage[key]['blocks_per_row'] * coverage[key]['miss_ratio']
+                        for key, counts in planned.items()
+                    )
+                    if estimated_blocks < threshold:
+                        for key in planned:
+                            coverage[key]['skips'] += 1
+                        skipped_count += 1
+                        logger.info(f"쿼리 {i+1}/{len(queries)} 건너뜀: 예상 신규 블록 {estimated_blocks:.1f}개")
+                        continue
+            
+            scans = []
+            collect_plan_scans(get_query_plan(cursor, query, analyze=True), scans)
+            
+            query_read = 0
+            for key, counts in get_scan_block_counts(scans).items():
+                blocks = counts['read'] + counts['hit']
+                query_read += counts['read']
+                blocks_hit += counts['hit']
+                
+                # 블록을 읽지 않은 노드(실행되지 않은 노드 등)는 기록하지 않음
+                if blocks > 0:
+                    coverage[key] = {
+                        'blocks_per_row': blocks / max(counts['rows'], 1),
+                        'miss_ratio': counts['read'] / blocks,
+                        'skips': 0
+                    }
+            blocks_read += query_read
+            
+            query_end_time = time.time()
+            success_count += 1
+            logger.info(f"쿼리 {i+1}/{len(queries)} 실행 성공: 신규 블록 {query_read}개, {query_end_time - query_start_time:.2f} 초")
+        except Exception as e:
+            logger.warning(f"쿼리 {i+1}/{len(queries)} 실행 실패: {str(e)}")
+            # 실패한 트랜잭션이 이후 쿼리 실행을 막지 않도록 롤백
+            conn.rollback()
+    
+    cursor.close()
+    
+    summary = {
+        'successQueries': success_count,
+        'skippedQueries': skipped_count,
+        'totalQueries': len(queries),
+        'blocksRead': blocks_read,
+        'blocksHit': blocks_hit
+    }
+    
+    end_time = time.time()
+    logger.info(f"DB warming 완료: {json.dumps(summary)}, 총 소요 시간: {end_time - start_time:.2f} 초")
+    
+    return summary
+
+def get_tier_budgets():
+    """
+    환경 변수에서 계층별(Tier) Warming 시간 예산을 가져오는 함수
+    
+    Returns:
+        dict: 계층 이름과 시간 예산(초)을 포함한 사전
+        
+    Raises:
+        ValueError: 시간 예산 값이 올바르지 않은 경우
+    """
+    budgets = {}
+    
+    for tier, env_name, default in TIER_BUDGET_ENVS:
+        value = os.environ.get(env_name, default)
+        try:
+            budget = float(value)
+        except ValueError:
+            budget = -1
+        
+        if budget < 0:
+            error_msg = f"환경 변수 '{env_name}'의 값이 올바르지 않습니다: {value}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        budgets[tier] = budget
+    
+    logger.info(f"계층별 시간 예산(초): {json.dumps(budgets)}")
+    
+    return budgets
+
+def get_hot_indexes(conn, queries, deadline):
+    """
+    Top-N 쿼리의 실행 계획을 조회하여 사용되는 B-tree 인덱스 목록을 반환하는 함수
+    
+    pg_stat_statements에서 추출한 쿼리는 상수가 $1 등 파라미터로 바뀌어 있으므로
+    PostgreSQL 16 이상에서는 EXPLAIN (GENERIC_PLAN)으로 실행 계획을 조회한다.
+    
+    Args:
+        conn (psycopg2.connection): 데이터베이스 연결
+        queries (list): 실행 계획을 조회할 쿼리 목록
+        deadline (float): 실행 종료 시각(time.time() 기준)
+        
+    Returns:
+        tuple: (사용 빈도 순으로 정렬된 (인덱스 이름(스키마 포함), 사용 쿼리 수) 목록, 실행 계획 조회 실패 수)
+    """
+    start_time = time.time()
+    logger.info(f"Top-N 쿼리 실행 계획에서 인덱스 확인 중: {len(queries)}개 쿼리")
+    
+    # GENERIC_PLAN 옵션은 PostgreSQL 16부터 지원
+    generic = conn.server_version >= 160000
+    if not generic:
+        logger.warning(f"PostgreSQL 16 미만(server_version={conn.server_version})이므로 파라미터($1 등)가 포함된 쿼리는 실행 계획을 조회할 수 없습니다.")
+    
+    usage_counts = {}
+    failed_count = 0
+    cursor = conn.cursor()
+    
+    for i, query in enumerate(queries):
+        if time.time() >= deadline:
+            logger.info(f"시간 예산 소진으로 실행 계획 조회 중단: {i}/{len(queries)}개 조회")
+            break
+        
+        try:
+            scans = []
+            collect_plan_scans(get_query_plan(cursor, query, generic=generic), scans)
+            
+            for scan in scans:
+                if scan['index']:
+                    key = (scan['schema'], scan['index'])
+                    usage_counts[key] = usage_counts.get(key, 0) + 1
+        except Exception as e:
+            failed_count += 1
+            logger.warning(f"쿼리 {i+1}/{len(queries)} 실행 계획 조회 실패: {str(e)}")
+            conn.rollback()
+    
+    # 스키마와 인덱스 이름으로 인덱스를 찾고 B-tree 인덱스만 대상으로 함
+    hot_indexes = []
+    for (schema, index_name), count in sorted(usage_counts.items(), key=lambda x: x[1], reverse=True):
+        cursor.execute(
+            """
+            SELECT c.oid::regclass::text
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_am a ON a.oid = c.relam
+            WHERE n.nspname = %s
+              AND c.relname = %s
+              AND a.amname = 'btree'
+            """,
+            (schema, index_name)
+        )
+        row = cursor.fetchone()
+        if row:
+            hot_indexes.append((row[0], count))
+            logger.info(f"대상 인덱스: {row[0]} (사용 쿼리 수: {count})")
+    
+    cursor.close()
+    
+    end_time = time.time()
+    logger.info(f"인덱스 확인 완료: {len(hot_indexes)}개 인덱스, 실행 계획 조회 실패 {failed_count}개, 소요 시간: {end_time - start_time:.2f} 초")
+    
+    return hot_indexes, failed_count
+
+def check_tier_privileges(conn, index_name):
+    """
+    인덱스 계층 적재에 필요한 함수를 실행할 수 있는지 확인하는 함수
+    
+    pageinspect 함수는 기본적으로 superuser만 실행할 수 있으므로 대상 인덱스에
+    bt_metap, pg_prewarm을 직접 호출하여 확인한다.
+    
+    Args:
+        conn (psycopg2.connection): 데이터베이스 연결
+        index_name (str): 확인에 사용할 인덱스 이름
+        
+    Returns:
+        dict: 계층 이름별 오류 메시지 (실행 가능하면 None)
+    """
+    checks = [
+        ('index_internal', "SELECT level FROM bt_metap(%s)"),
+        ('index_leaf', "SELECT pg_prewarm(%s::regclass, 'buffer', 'main', 0, 0)"),
+    ]
+    errors = {}
+    cursor = conn.cursor()
+    
+    for tier, sql in checks:
+        try:
+            cursor.execute(sql, (index_name,))
+            cursor.fetchone()
+            errors[tier] = None
+        except Exception as e:
+            errors[tier] = str(e).strip()
+            logger.error(f"계층 {tier} 실행 권한 확인 실패: {errors[tier]}")
+            conn.rollback()
+    
+    cursor.close()
+    
+    return errors
+
+def warm_index_internal_pages(conn, indexes, deadline):
+    """
+    B-tree 인덱스의 루트 및 내부(Internal) 페이지를 적재하는 함수
+    
+    bt_metap으로 루트 페이지와 트리 높이를 확인한 뒤, 루트부터 레벨 1까지
+    bt_page_items로 하위 페이지를 따라가며 내부 페이지만 읽는다.
+    
+    Args:
+        conn (psycopg2.connection): 데이터베이스 연결
+        indexes (list): 대상 인덱스 이름 목록
+        deadline (float): 실행 종료 시각(time.time() 기준)
+        
+    Returns:
+        tuple: (적재된 페이지 수, 인덱스별 오류 메시지 사전)
+    """
+    start_time = time.time()
+    logger.info(f"인덱스 내부 페이지 적재 시작: {len(indexes)}개 인덱스")
+    
+    page_count = 0
+    errors = {}
+    cursor = conn.cursor()
+    
+    for index_name in indexes:
+        if time.time() >= deadline:
+            logger.info("시간 예산 소진으로 인덱스 내부 페이지 적재 중단")
+            break
+        
+        try:
+            cursor.execute(
+                "SELECT root, level, pg_relation_size(%s::regclass) / current_setting('block_size')::bigint FROM bt_metap(%s)",
+                (index_name, index_name)
+            )
+            root, level, block_count = cursor.fetchone()
+            
+            # level 0은 루트가 곧 리프인 경우이므로 내부 페이지가 없음
+            blocks = [root] if level > 0 else []
+            index_page_count = 0
+            
+            while blocks and level > 0 and time.time() < deadline:
+                child_blocks = set()
+                for block in blocks:
+                    if time.time() >= deadline:
+                        break
+                    
+                    # 가장 오른쪽이 아닌 페이지의 첫 번째 항목은 High Key이므로 제외
+                    cursor.execute(
+                        """
+                        SELECT DISTINCT (i.ctid::text::point)[0]::bigint
+                        FROM bt_page_items(%s, %s) i
+                        WHERE i.itemoffset > CASE
+                            WHEN (SELECT s.btpo_next FROM bt_page_stats(%s, %s) s) <> 0 THEN 1
+                            ELSE 0
+                        END
+                        """,
+                        (index_name, block, index_name, block)
+                    )
+                    child_blocks.update(row[0] for row in cursor.fetchall())
+                    index_page_count += 1
+                
+                # 다음 레벨이 리프(level 0)라면 리프 페이지는 다음 계층에서 적재
+                level -= 1
+                blocks = sorted(b for b in child_blocks if 0 < b < block_count) if level > 0 else []
+            
+            page_count += index_page_count
+            logger.info(f"인덱스 {index_name} 내부 페이지 적재: {index_page_count}개 페이지")
+        except Exception as e:
+            errors[index_name] = str(e).strip()
+            logger.warning(f"인덱스 {index_name} 내부 페이지 적재 실패: {errors[index_name]}")
+            conn.rollback()
+    
+    cursor.close()
+    
+    end_time = time.time()
+    logger.info(f"인덱스 내부 페이지 적재 완료: {page_count}개 페이지, 소요 시간: {end_time - start_time:.2f} 초")
+    
+    return page_count, errors
+
+def warm_index_leaf_pages(conn, indexes, deadline):
+    """
+    B-tree 인덱스의 리프(Leaf) 페이지를 포함한 인덱스 전체를 적재하는 함수
+    
+    pg_prewarm으로 메타 페이지(블록 0)를 제외한 인덱스의 모든 블록을 LEAF_CHUNK_BLOCKS 단위로 읽어
+    버퍼 캐시에 적재한다. 리프 페이지만 골라 읽지 않으므로 내부 페이지와 빈 페이지도 함께 적재되며,
+    반환되는 페이지 수도 이 블록들을 모두 포함한다.
+    큰 인덱스 하나가 시간 예산을 모두 쓰지 않도록 인덱스를 번갈아 가며 한 청크씩 적재한다.
+    
+    Args:
+        conn (psycopg2.connection): 데이터베이스 연결
+        indexes (list): 대상 인덱스 이름 목록 (사용 빈도 순)
+        deadline (float): 실행 종료 시각(time.time() 기준)
+        
+    Returns:
+        tuple: (적재된 페이지 수, 인덱스별 오류 메시지 사전)
+    """
+    start_time = time.time()
+    logger.info(f"인덱스 리프 페이지 적재 시작: {len(indexes)}개 인덱스")
+    
+    page_count = 0
+    errors = {}
+    # 인덱스별 [다음에 적재할 블록, 전체 블록 수, 적재된 페이지 수]
+    progress = {}
+    cursor = conn.cursor()
+    
+    for index_name in indexes:
+        try:
+            cursor.execute(
+                "SELECT pg_relation_size(%s::regclass) / current_setting('block_size')::bigint",
+                (index_name,)
+            )
+            # 블록 0은 메타 페이지이므로 블록 1부터 적재
+            progress[index_name] = [1, cursor.fetchone()[0], 0]
+        except Exception as e:
+            errors[index_name] = str(e).strip()
+            logger.warning(f"인덱스 {index_name} 크기 확인 실패: {errors[index_name]}")
+            conn.rollback()
+    
+    pending = [name for name in indexes if name in progress and progress[name][0] < progress[name][1]]
+    
+    while pending and time.time() < deadline:
+        for index_name in list(pending):
+            if time.time() >= deadline:
+                logger.info("시간 예산 소진으로 인덱스 리프 페이지 적재 중단")
+                break
+            
+            first_block, block_count, _ = progress[index_name]
+            last_block = min(first_block + LEAF_CHUNK_BLOCKS, block_count) - 1
+            try:
+                cursor.execute(
+                    "SELECT pg_prewarm(%s::regclass, 'buffer', 'main', %s, %s)",
+                    (index_name, first_block, last_block)
+                )
+                loaded = cursor.fetchone()[0]
+                progress[index_name][2] += loaded
+                page_count += loaded
+                progress[index_name][0] = last_block + 1
+            except Exception as e:
+                errors[index_name] = str(e).strip()
+                logger.warning(f"인덱스 {index_name} 리프 페이지 적재 실패: {errors[index_name]}")
+                conn.rollback()
+                pending.remove(index_name)
+                continue
+            
+            if progress[index_name][0] >= block_count:
+                pending.remove(index_name)
+    
+    for index_name, (_, block_count, loaded) in progress.items():
+        logger.info(f"인덱스 {index_name} 리프 페이지 적재: {loaded}/{max(block_count - 1, 0)}개 페이지")
+    
+    cursor.close()
+    
+    end_time = time.time()
+    logger.info(f"인덱스 리프 페이지 적재 완료: {page_count}개 페이지, 소요 시간: {end_time - start_time:.2f} 초")
+    
+    return page_count, errors
+
+def execute_tiered_warming(conn, queries, lambda_deadline, coverage_threshold=None):
+    """
+    인덱스 우선 계층형(Tiered) DB warming을 실행하는 함수
+    
+    1) Top-N 쿼리가 사용하는 인덱스의 내부 페이지
+    2) 같은 인덱스의 메타 페이지 이후 전체 블록 (리프 페이지 포함)
+    3) Top-N 쿼리 실행을 통한 힙(Heap) 페이지
+    순서로 적재하며, 각 계층은 별도의 시간 예산 내에서 실행된다.
+    각 계층의 종료 시각은 Lambda 종료 시각(lambda_deadline)을 넘지 않는다.
+    인덱스 계층에 필요한 권한이 없으면 해당 계층은 건너뛰고 summary에 오류를 기록하며,
+    두 인덱스 계층 모두 실행할 수 없으면 쿼리 실행 방식으로 대체(fallback)하여
+    힙 계층의 시간 예산 대신 Lambda 종료 시각까지 쿼리를 실행한다.
+    
+    Args:
+        conn (psycopg2.connection): 데이터베이스 연결
+        queries (list): 실행할 쿼리 목록
+        lambda_deadline (float): Lambda 작업 종료 시각(time.time() 기준)
+        coverage_threshold (float): 힙 계층의 중복 적재 쿼리 건너뛰기 기준, None이면 사용하지 않음
+        
+    Returns:
+        dict: 계층별 적재 결과
+    """
+    start_time = time.time()
+    logger.info("계층형 DB warming 시작")
+    
+    budgets = get_tier_budgets()
+    summary = {}
+    
+    # 계층 1: 인덱스 내부 페이지 (대상 인덱스 확인 시간 포함)
+    tier_start_time = time.time()
+    deadline = min(tier_start_time + budgets['index_internal'], lambda_deadline)
+    hot_indexes, plan_errors = get_hot_indexes(conn, queries, deadline)
+    indexes = [index_name for index_name, _ in hot_indexes]
+    
+    if indexes:
+        tier_errors = check_tier_privileges(conn, indexes[0])
+    else:
+        tier_errors = {'index_internal': None, 'index_leaf': None}
+    
+    summary['index_internal'] = {'indexes': len(indexes), 'planErrors': plan_errors}
+    if tier_errors['index_internal']:
+        summary['index_internal']['error'] = tier_errors['index_internal']
+    else:
+        pages, errors = warm_index_internal_pages(conn, indexes, deadline)
+        summary['index_internal']['pages'] = pages
+        summary['index_internal']['errors'] = errors
+    summary['index_internal']['elapsedTime'] = f"{time.time() - tier_start_time:.2f} 초"
+    
+    # 계층 2: 인덱스 리프 페이지
+    tier_start_time = time.time()
+    deadline = min(tier_start_time + budgets['index_leaf'], lambda_deadline)
+    summary['index_leaf'] = {}
+    if tier_errors['index_leaf']:
+        summary['index_leaf']['error'] = tier_errors['index_leaf']
+    else:
+        pages, errors = warm_index_leaf_pages(conn, indexes, deadline)
+        summary['index_leaf']['pages'] = pages
+        summary['index_leaf']['errors'] = errors
+    summary['index_leaf']['elapsedTime'] = f"{time.time() - tier_start_time:.2f} 초"
+    
+    if tier_errors['index_internal'] and tier_errors['index_leaf']:
+        summary['fallback'] = 'query'
+        logger.error("인덱스 계층을 실행할 수 없어 쿼리 실행 방식으로 대체합니다.")
+    
+    # 계층 3: 쿼리 실행을 통한 힙 페이지
+    # 쿼리 실행 방식으로 대체된 경우 힙 계층 시간 예산 대신 Lambda 종료 시각까지 실행
+    tier_start_time = time.time()
+    if summary.get('fallback'):
+        deadline = lambda_deadline
+    else:
+        deadline = min(tier_start_time + budgets['heap'], lambda_deadline)
+    if coverage_threshold is not None:
+        summary['heap'] = execute_coverage_warming_queries(conn, queries, coverage_threshold, deadline)
+    else:
+        success_count = execute_warming_queries(conn, queries, deadline)
+        summary['heap'] = {
+            'successQueries': success_count,
+            'totalQueries': len(queries)
+        }
+    summary['heap']['elapsedTime'] = f"{time.time() - tier_start_time:.2f} 초"
+    
+    end_time = time.time()
+    logger.info(f"계층형 DB warming 완료: {json.dumps(summary, ensure_ascii=False)}, 총 소요 시간: {end_time - start_time:.2f} 초")
+    
+    return summary
+
 def lambda_handler(event, context):
     """
     Lambda 함수의 진입점
@@ -287,8 +921,33 @@ def lambda_handler(event, context):
         # CSV 파일에서 쿼리 추출
         queries = parse_queries_from_csv(csv_content)
         
-        # DB warming 쿼리 실행
-        success_count = execute_warming_queries(conn, queries)
+        # Warming 방식 확인 (query: 쿼리 실행, tiered: 인덱스 우선 계층형)
+        warming_mode = os.environ.get('WARMING_MODE', 'query')
+        if warming_mode not in ('query', 'tiered'):
+            error_msg = f"환경 변수 'WARMING_MODE'의 값이 올바르지 않습니다: {warming_mode}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # 중복 적재 쿼리 건너뛰기 기준 확인 (warming 시작 전에 값 검증)
+        coverage_threshold = get_coverage_threshold()
+        
+        # DB warming 실행
+        tier_summary = None
+        coverage_summary = None
+        if warming_mode == 'tiered':
+            # Lambda 제한 시간 안에 응답할 수 있도록 작업 종료 시각 계산
+            lambda_deadline = time.time() + context.get_remaining_time_in_millis() / 1000 - LAMBDA_SAFETY_MARGIN
+            if lambda_deadline <= time.time():
+                error_msg = f"Lambda 남은 실행 시간이 여유 시간({LAMBDA_SAFETY_MARGIN}초)보다 짧아 계층형 warming을 실행할 수 없습니다."
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            tier_summary = execute_tiered_warming(conn, queries, lambda_deadline, coverage_threshold)
+            success_count = tier_summary['heap']['successQueries']
+        elif coverage_threshold is not None:
+            coverage_summary = execute_coverage_warming_queries(conn, queries, coverage_threshold)
+            success_count = coverage_summary['successQueries']
+        else:
+            success_count = execute_warming_queries(conn, queries)
         
         # 작업 완료 후 연결 종료
         conn.close()
@@ -297,11 +956,21 @@ def lambda_handler(event, context):
         total_time = end_time - start_time
         logger.info(f"Lambda 함수 성공적으로 완료: 총 실행 시간 {total_time:.2f} 초")
         
-        return {
+        body = f'DB warming 완료: {success_count}/{len(queries)} 쿼리 성공'
+        if tier_summary is not None and tier_summary.get('fallback'):
+            body += ' (인덱스 계층 실행 불가로 쿼리 실행 방식으로 대체)'
+        
+        response = {
             'statusCode': 200,
-            'body': json.dumps(f'DB warming 완료: {success_count}/{len(queries)} 쿼리 성공'),
+            'body': json.dumps(body),
             'executionTime': f"{total_time:.2f} 초"
         }
+        if tier_summary is not None:
+            response['tierSummary'] = tier_summary
+        if coverage_summary is not None:
+            response['coverageSummary'] = coverage_summary
+        
+        return response
     
     except Exception as e:
         logger.error(f"Lambda 함수 실행 중 오류 발생: {str(e)}")